@@ -4,7 +4,7 @@ from collections import defaultdict
 from collections.abc import MutableMapping
 from copy import copy
 from string import ascii_letters, digits
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from zarr.meta import Metadata2, Metadata3
 from zarr.util import normalize_storage_path
@@ -248,8 +248,7 @@ class StoreV3(BaseStore):
             all_keys = self.list()
         else:
             all_keys = self.list_prefix(prefix)
-        for key in all_keys:
-            self.erase(key)
+        _delete_keys(self, all_keys)
 
     def list_dir(self, prefix):
         """
@@ -261,14 +260,16 @@ class StoreV3(BaseStore):
         all_keys = self.list_prefix(prefix)
         len_prefix = len(prefix)
         keys = []
-        prefixes = []
+        prefixes = set()
         for k in all_keys:
-            trail = k[len_prefix:]
-            if "/" not in trail:
-                keys.append(prefix + trail)
+            # all keys start with prefix, so search for a separator after it
+            # rather than slicing and splitting every key
+            sep = k.find("/", len_prefix)
+            if sep < 0:
+                keys.append(k)
             else:
-                prefixes.append(prefix + trail.split("/", maxsplit=1)[0] + "/")
-        return keys, list(set(prefixes))
+                prefixes.add(k[: sep + 1])
+        return keys, list(prefixes)
 
     def list(self):
         return list(self.keys())
@@ -294,7 +295,7 @@ class StoreV3(BaseStore):
         return False
 
     def get_partial_values(
-        self, key_ranges: Sequence[Tuple[str, Tuple[int, Optional[int]]]]
+        self, key_ranges: Iterable[Tuple[str, Tuple[int, Optional[int]]]]
     ) -> List[Union[bytes, memoryview, bytearray]]:
         """Get multiple partial values.
         key_ranges can be an iterable of key, range pairs,
@@ -305,17 +306,25 @@ class StoreV3(BaseStore):
         from the end of the file.
         A key may occur multiple times with different ranges.
         Inserts None for missing keys into the returned list."""
-        results: List[Union[bytes, memoryview, bytearray]] = [None] * len(key_ranges)  # type: ignore[list-item] # noqa: E501
         indexed_ranges_by_key: Dict[str, List[Tuple[int, Tuple[int, Optional[int]]]]] = defaultdict(
             list
         )
+        # count ranges while grouping them, so key_ranges is only iterated once
+        # and does not need to be materialized up front
+        n_ranges = 0
         for i, (key, range_) in enumerate(key_ranges):
             indexed_ranges_by_key[key].append((i, range_))
+            n_ranges += 1
+        results: List[Union[bytes, memoryview, bytearray]] = [None] * n_ranges  # type: ignore[list-item] # noqa: E501
         for key, indexed_ranges in indexed_ranges_by_key.items():
             try:
                 value = self[key]
             except KeyError:  # pragma: no cover
                 continue
+            if isinstance(value, bytes):
+                # slice through a memoryview, so each range shares the memory
+                # of the value instead of being copied out of it
+                value = memoryview(value)
             for i, (range_from, range_length) in indexed_ranges:
                 if range_length is None:
                     results[i] = value[range_from:]
@@ -620,12 +629,21 @@ def _rename_from_keys(store: BaseStore, src_path: str, dst_path: str) -> None:
             raise ValueError(f"no item {src_path} found to rename")
 
 
+def _delete_keys(store: StoreLike, keys: List[str]) -> None:
+    if hasattr(store, "delitems"):
+        # let stores with a bulk delete remove all keys in one call
+        if keys:
+            store.delitems(keys)
+    else:
+        for key in keys:
+            del store[key]
+
+
 def _rmdir_from_keys(store: StoreLike, path: Optional[str] = None) -> None:
     # assume path already normalized
     prefix = _path_to_prefix(path)
-    for key in list(store.keys()):
-        if key.startswith(prefix):
-            del store[key]
+    keys = [key for key in store.keys() if key.startswith(prefix)]
+    _delete_keys(store, keys)
 
 
 def _rmdir_from_keys_v3(store: StoreV3, path: str = "") -> None:
@@ -122,6 +122,17 @@ class FSStoreV3(FSStore, StoreV3):
     # FSStoreV3 doesn't use this (FSStore uses it within _normalize_key)
     _META_KEYS = ()
 
+    # byte ranges on the same key that are at most this many bytes apart are
+    # fetched with a single request by get_partial_values
+    max_gap = 32 * 1024
+    # merged requests are not grown beyond this many bytes, so that large
+    # reads of neighbouring ranges are still fetched concurrently
+    max_block = 16 * 1024 * 1024
+
+    # object stores without real directories, where a prefix only exists while
+    # keys remain under it, so list_dir can use a single-level listing
+    _delimited_listing_protocols = frozenset({"s3", "s3a", "gs", "gcs", "abfs", "az"})
+
     def __setitem__(self, key, value):
         self._validate_key(key)
         super().__setitem__(key, value)
@@ -137,6 +148,39 @@ class FSStoreV3(FSStore, StoreV3):
         key = normalize_storage_path(key).lstrip("/")
         return key.lower() if self.normalize_keys else key
 
+    def list_dir(self, prefix):
+        protocols = self.fs.protocol
+        if isinstance(protocols, str):
+            protocols = (protocols,)
+        if self._delimited_listing_protocols.isdisjoint(protocols):
+            # directories on other filesystems can outlive the keys in them,
+            # so only report prefixes that still contain keys
+            return StoreV3.list_dir(self, prefix)
+
+        if prefix:
+            assert prefix.endswith("/")
+
+        # list a single level, so that the object store splits off prefixes
+        # (a delimited listing) instead of listing every key under the prefix
+        dir_path = self.dir_path(prefix).rstrip("/")
+        try:
+            entries = self.fs.ls(dir_path, detail=True)
+        except OSError:
+            return [], []
+        keys = []
+        prefixes = []
+        for entry in entries:
+            entry_path = entry["name"].rstrip("/")
+            if entry_path == dir_path:
+                # some filesystems list the directory itself
+                continue
+            name = entry_path.rsplit("/", 1)[-1]
+            if entry["type"] == "directory":
+                prefixes.append(prefix + name + "/")
+            else:
+                keys.append(prefix + name)
+        return keys, prefixes
+
     def getsize(self, path=None):
         size = 0
         if path is None or path == "":
@@ -208,19 +252,66 @@ class FSStoreV3(FSStore, StoreV3):
         from the end of the file.
         A key may occur multiple times with different ranges.
         Inserts None for missing keys into the returned list."""
-        results = []
-        for key, (range_start, range_length) in key_ranges:
-            key = self._normalize_key(key)
-            path = self.dir_path(key)
-            try:
-                if range_start is None or range_length is None:
-                    end = None
-                else:
-                    end = range_start + range_length
-                result = self.fs.cat_file(path, start=range_start, end=end)
-            except self.map.missing_exceptions:
-                result = None
-            results.append(result)
+        # ranges with a known, non-negative start and a length can be merged
+        # with nearby ranges on the same key; all other ranges are requested
+        # on their own
+        n_ranges = 0
+        bounded = []
+        requests = []
+        # a key is usually requested with several ranges, so resolve each key
+        # to its filesystem path only once
+        paths = {}
+        for i, (key, (range_start, range_length)) in enumerate(key_ranges):
+            n_ranges += 1
+            path = paths.get(key)
+            if path is None:
+                path = paths[key] = self.dir_path(self._normalize_key(key))
+            if range_start is None or range_length is None:
+                requests.append((path, range_start, None, [(i, range_start, None)]))
+            elif range_start < 0:
+                end = range_start + range_length
+                requests.append((path, range_start, end, [(i, range_start, end)]))
+            else:
+                bounded.append((path, range_start, range_start + range_length, i))
+
+        # coalesce overlapping or nearby ranges on the same key into one request
+        merged = []
+        for path, start, end, i in sorted(bounded):
+            if (
+                merged
+                and merged[-1][0] == path
+                and start - merged[-1][2] <= self.max_gap
+                and max(merged[-1][2], end) - merged[-1][1] <= self.max_block
+            ):
+                m_path, m_start, m_end, members = merged[-1]
+                merged[-1] = (m_path, m_start, max(m_end, end), members)
+            else:
+                members = []
+                merged.append((path, start, end, members))
+            members.append((i, start, end))
+        requests.extend(merged)
+
+        # fetch all requests with a single call, so that async filesystems
+        # issue them concurrently instead of one after another
+        responses = self.fs.cat_ranges(
+            [r[0] for r in requests],
+            [r[1] for r in requests],
+            [r[2] for r in requests],
+            on_error="return",
+        )
+        results = [None] * n_ranges
+        for (path, start, end, members), response in zip(requests, responses):
+            if isinstance(response, self.map.missing_exceptions):
+                continue
+            elif isinstance(response, Exception):
+                raise response
+            if len(members) == 1:
+                # the request covers exactly one range
+                results[members[0][0]] = response
+            else:
+                view = memoryview(response)
+                for i, member_start, member_end in members:
+                    results[i] = view[member_start - start : member_end - start]
         return results
 
 
@@ -2103,6 +2103,14 @@ class Array:
         # store selected data in output
         out[out_selection] = tmp
 
+    def _existing_chunk_keys(self, ckeys):
+        """Return the subset of `ckeys` present in the chunk store."""
+        if hasattr(self.chunk_store, "exists_many"):
+            # let stores that can probe many keys at once do so
+            exists = self.chunk_store.exists_many(ckeys)
+            return [ckey for ckey, e in zip(ckeys, exists) if e]
+        return [ckey for ckey in ckeys if ckey in self.chunk_store]
+
     def _chunk_getitems(
         self, lchunk_coords, lchunk_selection, out, lout_selection, drop_axes=None, fields=None
     ):
@@ -2146,8 +2154,7 @@ class Array:
             partial_read_decode = True
             cdatas = {
                 ckey: PartialReadBuffer(ckey, self.chunk_store)
-                for ckey in ckeys
-                if ckey in self.chunk_store
+                for ckey in self._existing_chunk_keys(ckeys)
             }
         elif (
             self._partial_decompress
@@ -2162,8 +2169,7 @@ class Array:
                 ckey: UncompressedPartialReadBufferV3(
                     ckey, self.chunk_store, itemsize=self.itemsize
                 )
-                for ckey in ckeys
-                if ckey in self.chunk_store
+                for ckey in self._existing_chunk_keys(ckeys)
             }
         elif hasattr(self.chunk_store, "get_partial_values"):
             partial_read_decode = False
@@ -1481,7 +1481,10 @@ class FSStore(Store):
         if self.mode == "r":
             raise ReadOnlyError()
         # only remove the keys that exist in the store
-        nkeys = [self._normalize_key(key) for key in keys if key in self]
+        keys = list(keys)
+        nkeys = [
+            self._normalize_key(key) for key, exists in zip(keys, self.exists_many(keys)) if exists
+        ]
         # rm errors if you pass an empty collection
         if len(nkeys) > 0:
             self.map.delitems(nkeys)
@@ -1490,6 +1493,29 @@ class FSStore(Store):
         key = self._normalize_key(key)
         return key in self.map
 
+    def exists_many(self, keys: Sequence[str]) -> List[bool]:
+        """Check which of `keys` are present in the store.
+
+        On asynchronous filesystems the keys are probed concurrently, rather
+        than with one round trip after another. Each key is normalized with
+        ``_normalize_key`` and probed directly on the filesystem, so any
+        ``__contains__`` override of a subclass is not consulted."""
+        paths = [self.dir_path(self._normalize_key(key)) for key in keys]
+        if getattr(self.fs, "async_impl", False):
+            from fsspec.asyn import sync
+
+            return sync(self.fs.loop, self._isfiles, paths)
+        return [self.fs.isfile(path) for path in paths]
+
+    async def _isfiles(self, paths):
+        from fsspec.asyn import _run_coros_in_chunks
+
+        # probe in batches, like fsspec's own bulk operations, rather than
+        # opening a request for every key at once
+        return await _run_coros_in_chunks(
+            [self.fs._isfile(path) for path in paths], batch_size=self.fs.batch_size, nofiles=True
+        )
+
     def __eq__(self, other):
         return type(self) is type(other) and self.map == other.map and self.mode == other.mode
 
@@ -2898,7 +2924,12 @@ class RedisStore(Store):
         return self.client[self._key(key)]
 
     def __setitem__(self, key, value):
-        value = ensure_bytes(value)
+        try:
+            # redis accepts memoryviews, so hand over the buffer without
+            # copying it into a new bytes object
+            value = memoryview(ensure_contiguous_ndarray_like(value)).cast("B")
+        except (TypeError, ValueError):
+            value = ensure_bytes(value)
         self.client[self._key(key)] = value
 
     def __delitem__(self, key):
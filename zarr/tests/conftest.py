@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 import pytest
@@ -6,3 +7,69 @@ import pytest
 @pytest.fixture(params=[str, pathlib.Path])
 def path_type(request):
     return request.param
+
+
+@pytest.fixture(scope="session")
+def s3_base():
+    # writable local S3 system, started once for the whole test session
+    import importlib.util
+    import shlex
+    import subprocess
+    import time
+    import urllib.request
+
+    if "BOTO_CONFIG" not in os.environ:  # pragma: no cover
+        os.environ["BOTO_CONFIG"] = "/dev/null"
+    if "AWS_ACCESS_KEY_ID" not in os.environ:  # pragma: no cover
+        os.environ["AWS_ACCESS_KEY_ID"] = "foo"
+    if "AWS_SECRET_ACCESS_KEY" not in os.environ:  # pragma: no cover
+        os.environ["AWS_SECRET_ACCESS_KEY"] = "bar"
+    # moto only runs in the server subprocess, so check that it is installed
+    # without paying for importing it here
+    for name in ("s3fs", "moto"):
+        if importlib.util.find_spec(name) is None:
+            pytest.skip(f"could not import '{name}'")
+
+    # give each pytest-xdist worker a server of its own, so that parallel
+    # runs do not collide on the port
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    port = 5555 + int(worker[2:])
+    endpoint_uri = f"http://127.0.0.1:{port}/"
+    proc = subprocess.Popen(
+        shlex.split(f"moto_server -p {port}"),
+        stderr=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+    )
+
+    timeout = 5
+    while timeout > 0:
+        try:
+            with urllib.request.urlopen(endpoint_uri) as r:
+                if r.status == 200:
+                    break
+        except Exception:  # pragma: no cover
+            pass
+        timeout -= 0.1  # pragma: no cover
+        time.sleep(0.1)  # pragma: no cover
+
+    import s3fs
+
+    s3so = dict(client_kwargs={"endpoint_url": endpoint_uri}, use_listings_cache=False)
+    s3fs.S3FileSystem(anon=False, **s3so).mkdir("test")
+    yield s3so
+    proc.terminate()
+    proc.wait()
+
+
+@pytest.fixture()
+def s3(request, s3_base):
+    import s3fs
+
+    # every test shares the storage options and bucket of the session's server
+    s3 = s3fs.S3FileSystem(anon=False, **s3_base)
+    request.cls.s3so = s3_base
+    yield
+    # remove only what the test wrote, rather than restarting the server
+    paths = s3.find("test")
+    if paths:
+        s3.rm(paths)
@@ -7,6 +7,7 @@ import sys
 import pickle
 import shutil
 import tempfile
+import types
 from contextlib import contextmanager
 from pickle import PicklingError
 from zipfile import ZipFile
@@ -57,7 +58,7 @@ from zarr.storage import (
     meta_root,
     normalize_store_arg,
 )
-from zarr.storage import FSStore, rename, listdir
+from zarr.storage import FSStore, rename, listdir, rmdir
 from zarr._storage.v3 import KVStoreV3
 from zarr.tests.util import CountingDict, have_fsspec, skip_test_env_var, abs_container, mktemp
 from zarr.util import ConstantMap, json_dumps
@@ -1278,6 +1279,23 @@ class TestFSStore(StoreTests):
         store2 = self.create_store(path="anypath")
         assert store1 == store2
 
+    def _check_exists_many(self, store):
+        store[self.root + "foo"] = b"bar"
+        store[self.root + "baz/0.0"] = b"qux"
+        keys = [self.root + k for k in ["foo", "baz/0.0", "baz", "missing"]]
+        assert store.exists_many(keys) == [True, True, False, False]
+        assert store.exists_many([]) == []
+
+    def test_exists_many(self):
+        self._check_exists_many(self.create_store())
+
+    @pytest.mark.usefixtures("s3")
+    def test_exists_many_s3(self):
+        # asynchronous filesystems probe the keys concurrently
+        store = self.create_store(path="s3://test/out.zarr", **self.s3so)
+        assert store.fs.async_impl
+        self._check_exists_many(store)
+
     @pytest.mark.usefixtures("s3")
     def test_s3(self):
         import zarr
@@ -1401,50 +1419,6 @@ class TestFSStoreFromFilesystem(StoreTests):
         return store
 
 
-@pytest.fixture()
-def s3(request):
-    # writable local S3 system
-    import shlex
-    import subprocess
-    import time
-
-    if "BOTO_CONFIG" not in os.environ:  # pragma: no cover
-        os.environ["BOTO_CONFIG"] = "/dev/null"
-    if "AWS_ACCESS_KEY_ID" not in os.environ:  # pragma: no cover
-        os.environ["AWS_ACCESS_KEY_ID"] = "foo"
-    if "AWS_SECRET_ACCESS_KEY" not in os.environ:  # pragma: no cover
-        os.environ["AWS_SECRET_ACCESS_KEY"] = "bar"
-    requests = pytest.importorskip("requests")
-    s3fs = pytest.importorskip("s3fs")
-    pytest.importorskip("moto")
-
-    port = 5555
-    endpoint_uri = f"http://127.0.0.1:{port}/"
-    proc = subprocess.Popen(
-        shlex.split(f"moto_server -p {port}"),
-        stderr=subprocess.DEVNULL,
-        stdout=subprocess.DEVNULL,
-    )
-
-    timeout = 5
-    while timeout > 0:
-        try:
-            r = requests.get(endpoint_uri)
-            if r.ok:
-                break
-        except Exception:  # pragma: no cover
-            pass
-        timeout -= 0.1  # pragma: no cover
-        time.sleep(0.1)  # pragma: no cover
-    s3so = dict(client_kwargs={"endpoint_url": endpoint_uri}, use_listings_cache=False)
-    s3 = s3fs.S3FileSystem(anon=False, **s3so)
-    s3.mkdir("test")
-    request.cls.s3so = s3so
-    yield
-    proc.terminate()
-    proc.wait()
-
-
 class TestNestedDirectoryStore(TestDirectoryStore):
     def create_store(self, normalize_keys=False, **kwargs):
         path = tempfile.mkdtemp()
@@ -2016,6 +1990,26 @@ class TestRedisStore(StoreTests):
         return store
 
 
+def test_redis_store_setitem_buffers(monkeypatch):
+    # a dict stands in for the redis client, so no server is needed
+    fake_redis = types.SimpleNamespace(Redis=lambda **kwargs: {})
+    monkeypatch.setitem(sys.modules, "redis", fake_redis)
+    store = RedisStore()
+
+    # contiguous buffers are passed on without a copy
+    value = np.arange(6, dtype="i4")
+    store["a"] = value
+    assert isinstance(store.client["zarr:a"], memoryview)
+    assert bytes(store.client["zarr:a"]) == value.tobytes()
+    store["b"] = b"xxx"
+    assert bytes(store.client["zarr:b"]) == b"xxx"
+
+    # other values are still copied into bytes
+    value = np.arange(6).reshape(2, 3)[:, :2]
+    store["c"] = value
+    assert store.client["zarr:c"] == value.tobytes()
+
+
 class TestLRUStoreCache(StoreTests):
     CountingClass = CountingDict
     LRUStoreClass = LRUStoreCache
@@ -2630,3 +2624,27 @@ def test_getitems_contexts():
     z[2:4]
     assert store.last_contexts == ConstantMap(["2", "3"], Context({"meta_array": "my_meta_array"}))
     assert isinstance(store.last_contexts, ConstantMap)
+
+
+def test_rmdir_uses_delitems():
+    class MyStore(KVStore):
+        def __init__(self):
+            super().__init__(dict())
+            self.delitems_calls = []
+
+        def delitems(self, keys):
+            self.delitems_calls.append(sorted(keys))
+            for key in keys:
+                del self[key]
+
+    store = MyStore()
+    store["foo/a"] = b"a"
+    store["foo/b"] = b"b"
+    store["bar/c"] = b"c"
+    rmdir(store, "foo")
+    assert store.delitems_calls == [["foo/a", "foo/b"]]
+    assert list(store.keys()) == ["bar/c"]
+
+    # nothing to remove, so no bulk delete is issued
+    rmdir(store, "baz")
+    assert len(store.delitems_calls) == 1
@@ -59,7 +59,7 @@ from .test_storage import TestMemoryStore as _TestMemoryStore
 from .test_storage import TestSQLiteStore as _TestSQLiteStore
 from .test_storage import TestSQLiteStoreInMemory as _TestSQLiteStoreInMemory
 from .test_storage import TestZipStore as _TestZipStore
-from .test_storage import dimension_separator_fixture, s3, skip_if_nested_chunks  # noqa
+from .test_storage import dimension_separator_fixture, skip_if_nested_chunks  # noqa
 
 
 pytestmark = pytest.mark.skipif(not v3_api_available, reason="v3 api is not available")
@@ -186,6 +186,28 @@ class StoreV3Tests(_StoreTests):
     version = 3
     root = meta_root
 
+    def test_list_dir(self):
+        store = self.create_store()
+        store[meta_root + "a.group.json"] = b"x"
+        store[meta_root + "a/b.array.json"] = b"x"
+        store[meta_root + "a/c/d.array.json"] = b"x"
+        store[data_root + "a/b/c0/0"] = b"x"
+
+        keys, prefixes = store.list_dir(meta_root)
+        assert keys == [meta_root + "a.group.json"]
+        assert prefixes == [meta_root + "a/"]
+        keys, prefixes = store.list_dir(meta_root + "a/")
+        assert keys == [meta_root + "a/b.array.json"]
+        assert prefixes == [meta_root + "a/c/"]
+        assert store.list_dir(meta_root + "missing/") == ([], [])
+
+        # prefixes whose keys have all been deleted are no longer listed
+        if store.is_erasable():
+            del store[meta_root + "a/c/d.array.json"]
+            keys, prefixes = store.list_dir(meta_root + "a/")
+            assert keys == [meta_root + "a/b.array.json"]
+            assert prefixes == []
+
     def test_getsize(self):
         # TODO: determine proper getsize() behavior for v3
         #       Currently returns the combined size of entries under
@@ -305,6 +327,21 @@ class StoreV3Tests(_StoreTests):
                 (data_root + "foo", (-3, 2)),
             ]
         )
+        assert [b"a", None, b"z"] == store.get_partial_values(
+            [
+                (data_root + "foo", (0, 1)),
+                (data_root + "missing", (0, 1)),
+                (data_root + "baz", (0, 1)),
+            ]
+        )
+        # key_ranges may be any iterable, not just a sequence
+        assert [b"a", b"z"] == store.get_partial_values(
+            (key, (0, 1)) for key in [data_root + "foo", data_root + "baz"]
+        )
+        # many ranges on the same key in one call
+        assert [b"abcdefg"[i:] for i in range(5)] == store.get_partial_values(
+            [(data_root + "foo", (i, None)) for i in range(5)]
+        )
 
     def test_set_partial_values(self):
         store = self.create_store()
@@ -343,6 +380,17 @@ class TestMappingStoreV3(StoreV3Tests):
         # Generic mappings support non-buffer types
         pass
 
+    def test_get_partial_values_no_copy(self):
+        store = self.create_store()
+        value = b"abcdefg"
+        store[data_root + "foo"] = value
+        results = store.get_partial_values(
+            [(data_root + "foo", (1, 2)), (data_root + "foo", (-2, None))]
+        )
+        assert [b"bc", b"fg"] == results
+        # ranges are views on the stored bytes rather than copies
+        assert all(isinstance(r, memoryview) and r.obj is value for r in results)
+
 
 class TestMemoryStoreV3(_TestMemoryStore, StoreV3Tests):
     def create_store(self, **kwargs):
@@ -392,6 +440,89 @@ class TestFSStoreV3(_TestFSStore, StoreV3Tests):
         assert np.dtype(None) == meta["data_type"]
         assert meta["chunk_grid"]["separator"] == "/"
 
+    @pytest.mark.usefixtures("s3")
+    def test_list_dir_s3(self):
+        # object stores are listed one level at a time
+        store = FSStoreV3("s3://test/out.zr3", **self.s3so)
+        store[meta_root + "a.group.json"] = b"x"
+        store[meta_root + "a/b.array.json"] = b"x"
+        store[meta_root + "a/c/d.array.json"] = b"x"
+
+        keys, prefixes = store.list_dir(meta_root + "a/")
+        assert keys == [meta_root + "a/b.array.json"]
+        assert prefixes == [meta_root + "a/c/"]
+        del store[meta_root + "a/c/d.array.json"]
+        keys, prefixes = store.list_dir(meta_root + "a/")
+        assert keys == [meta_root + "a/b.array.json"]
+        assert prefixes == []
+        assert store.list_dir(meta_root + "missing/") == ([], [])
+
+    def _count_cat_ranges(self, store, monkeypatch):
+        """Record the (start, end) ranges of every cat_ranges call on the store."""
+        calls = []
+        cat_ranges = store.fs.cat_ranges
+
+        def counting_cat_ranges(paths, starts, ends, **kwargs):
+            calls.append(list(zip(starts, ends)))
+            return cat_ranges(paths, starts, ends, **kwargs)
+
+        # the filesystem instance is cached by fsspec, so patch it reversibly
+        monkeypatch.setattr(store.fs, "cat_ranges", counting_cat_ranges)
+        return calls
+
+    def test_get_partial_values_coalesce(self, monkeypatch):
+        store = self.create_store()
+        store[data_root + "foo"] = bytes(range(100))
+        store[data_root + "bar"] = b"z"
+        store.max_gap = 16
+
+        calls = self._count_cat_ranges(store, monkeypatch)
+        key_ranges = [
+            (data_root + "foo", (20, 5)),
+            (data_root + "foo", (0, 5)),
+            (data_root + "foo", (3, 4)),
+            (data_root + "foo", (80, 5)),
+            (data_root + "bar", (0, 1)),
+            (data_root + "foo", (-5, None)),
+        ]
+        assert store.get_partial_values(key_ranges) == [
+            bytes(range(20, 25)),
+            bytes(range(0, 5)),
+            bytes(range(3, 7)),
+            bytes(range(80, 85)),
+            b"z",
+            bytes(range(95, 100)),
+        ]
+        # one call, with the three ranges near the start of foo merged
+        assert len(calls) == 1
+        assert set(calls[0]) == {(-5, None), (0, 1), (0, 25), (80, 85)}
+
+        # merged requests do not grow beyond max_block, even for adjacent ranges
+        calls.clear()
+        store.max_block = 10
+        key_ranges = [(data_root + "foo", (start, 5)) for start in (0, 5, 10)]
+        assert store.get_partial_values(key_ranges) == [
+            bytes(range(0, 5)),
+            bytes(range(5, 10)),
+            bytes(range(10, 15)),
+        ]
+        assert calls == [[(0, 10), (10, 15)]]
+
+    def test_get_partial_values_coalesce_many(self, monkeypatch):
+        store = self.create_store()
+        value = bytes(range(256)) * 4096
+        store[data_root + "foo"] = value
+
+        calls = self._count_cat_ranges(store, monkeypatch)
+        # small, non-adjacent ranges that are all within max_gap of each other
+        starts = [i * 1000 for i in reversed(range(32))]
+        key_ranges = [(data_root + "foo", (start, 10)) for start in starts]
+        assert store.get_partial_values(key_ranges) == [
+            value[start : start + 10] for start in starts
+        ]
+        # all fetched as a single range
+        assert calls == [[(0, 31 * 1000 + 10)]]
+
 
 @pytest.mark.skipif(have_fsspec is False, reason="needs fsspec")
 class TestFSStoreV3WithKeySeparator(StoreV3Tests):
@@ -685,3 +816,27 @@ def test_storage_transformer_interface():
     storage_transformer_methods.discard("__init__")
     storage_transformer_methods.discard("get_config")
     assert storage_transformer_methods == store_v3_methods
+
+
+def test_erase_prefix_uses_delitems():
+    class MyStore(KVStoreV3):
+        def __init__(self):
+            super().__init__(dict())
+            self.delitems_calls = []
+
+        def delitems(self, keys):
+            self.delitems_calls.append(sorted(keys))
+            for key in keys:
+                del self[key]
+
+    store = MyStore()
+    store[data_root + "foo/a"] = b"a"
+    store[data_root + "foo/b"] = b"b"
+    store[data_root + "bar/c"] = b"c"
+    store.erase_prefix(data_root + "foo/")
+    assert store.delitems_calls == [[data_root + "foo/a", data_root + "foo/b"]]
+    assert list(store.keys()) == [data_root + "bar/c"]
+
+    # nothing to remove, so no bulk delete is issued
+    store.erase_prefix(data_root + "baz/")
+    assert len(store.delitems_calls) == 1
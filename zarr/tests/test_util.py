@@ -6,6 +6,7 @@ import pytest
 
 from zarr.core import Array
 from zarr.util import (
+    _normalize_storage_path_str,
     ConstantMap,
     all_equal,
     flatten,
@@ -21,6 +22,7 @@ from zarr.util import (
     normalize_order,
     normalize_resize_args,
     normalize_shape,
+    normalize_storage_path,
     retry_call,
     tree_array_icon,
     tree_group_icon,
@@ -47,6 +49,34 @@ def test_normalize_shape():
         normalize_shape("foo")
 
 
+def test_normalize_storage_path():
+    assert "" == normalize_storage_path(None)
+    assert "" == normalize_storage_path("")
+    assert "" == normalize_storage_path("/")
+    assert "" == normalize_storage_path("///")
+    assert "foo/bar" == normalize_storage_path("foo/bar")
+    assert "foo/bar" == normalize_storage_path("//foo///bar/")
+    assert "foo/bar" == normalize_storage_path("\\foo\\bar\\")
+    assert "foo/bar" == normalize_storage_path(b"/foo/bar")
+    assert "foo/.bar/..baz" == normalize_storage_path("foo/.bar/..baz")
+    for path in [".", "..", "foo/./bar", "foo/../bar", "/foo/bar/..", "./foo"]:
+        with pytest.raises(ValueError):
+            normalize_storage_path(path)
+
+
+def test_normalize_storage_path_cached():
+    _normalize_storage_path_str.cache_clear()
+    assert "foo/bar" == normalize_storage_path("/foo/bar/")
+    assert "foo/bar" == normalize_storage_path("/foo/bar/")
+    info = _normalize_storage_path_str.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    # invalid paths are rejected on every call, not just the first
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            normalize_storage_path("foo/../bar")
+
+
 def test_normalize_chunks():
     assert (10,) == normalize_chunks((10,), (100,), 1)
     assert (10,) == normalize_chunks([10], (100,), 1)
@@ -5,6 +5,7 @@ import numbers
 from textwrap import TextWrapper
 import mmap
 import time
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
@@ -328,6 +329,9 @@ def normalize_fill_value(fill_value, dtype: np.dtype):
     return fill_value
 
 
+_invalid_path_segments = frozenset({".", ".."})
+
+
 def normalize_storage_path(path: Union[str, bytes, None]) -> str:
     # handle bytes
     if isinstance(path, bytes):
@@ -338,37 +342,35 @@ def normalize_storage_path(path: Union[str, bytes, None]) -> str:
         path = str(path)
 
     if path:
-        # convert backslash to forward slash
-        path = path.replace("\\", "/")
-
-        # ensure no leading slash
-        while len(path) > 0 and path[0] == "/":
-            path = path[1:]
-
-        # ensure no trailing slash
-        while len(path) > 0 and path[-1] == "/":
-            path = path[:-1]
-
-        # collapse any repeated slashes
-        previous_char = None
-        collapsed = ""
-        for char in path:
-            if char == "/" and previous_char == "/":
-                pass
-            else:
-                collapsed += char
-            previous_char = char
-        path = collapsed
+        return _normalize_storage_path_str(path)
+    else:
+        return ""
 
-        # don't allow path segments with just '.' or '..'
-        segments = path.split("/")
-        if any(s in {".", ".."} for s in segments):
-            raise ValueError("path containing '.' or '..' segment not allowed")
 
-    else:
-        path = ""
+# The same handful of keys and prefixes are normalized over and over while
+# traversing a hierarchy, so memoize the string normalization. Keys are short,
+# so the cache is bounded to at most a few hundred kilobytes.
+@lru_cache(maxsize=4096)
+def _normalize_storage_path_str(path: str) -> str:
+    # fast path for paths that are already normalized, which is the common
+    # case for keys produced by zarr itself
+    if "\\" not in path and "//" not in path and path[0] != "/" and path[-1] != "/":
+        if _invalid_path_segments.isdisjoint(path.split("/")):
+            return path
+        raise ValueError("path containing '.' or '..' segment not allowed")
+
+    # convert backslash to forward slash
+    path = path.replace("\\", "/")
+
+    # drop empty segments, which strips leading and trailing slashes and
+    # collapses any repeated slashes in a single pass
+    segments = [s for s in path.split("/") if s]
+
+    # don't allow path segments with just '.' or '..'
+    if not _invalid_path_segments.isdisjoint(segments):
+        raise ValueError("path containing '.' or '..' segment not allowed")
 
-    return path
+    return "/".join(segments)
 
 
 def buffer_size(v) -> int: